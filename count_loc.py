@@ -1,5 +1,7 @@
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Configuration ---
 
@@ -22,6 +24,8 @@ SOURCE_EXTENSIONS = {
     '.yaml',    # YAML
     # Add more relevant extensions here
 }
+# Tuple form for a single str.endswith check per file
+SOURCE_EXT_SUFFIXES = tuple(SOURCE_EXTENSIONS)
 
 # Define directories to always exclude
 # Uses set for efficient lookups
@@ -57,12 +61,25 @@ EXCLUDE_FILES = {
 
 # Define prefixes for single-line comments (used for simple heuristic)
 # This helps avoid counting comment lines as code
-SINGLE_LINE_COMMENT_MARKERS = {'#', '//'}
+# A tuple keeps the order stable, so the alternation below is deterministic
+SINGLE_LINE_COMMENT_MARKERS = ('#', '//')
+
+# Matches the first non-whitespace character of every non-empty line that does
+# not start with one of the comment markers, so a file is counted in one pass
+CODE_LINE_RE = re.compile(
+    rb'^[ \t\r\f\v]*(?!'
+    + b'|'.join(re.escape(marker.encode()) for marker in SINGLE_LINE_COMMENT_MARKERS)
+    + rb')\S',
+    re.MULTILINE,
+)
 
 # Optional: Exclude shadcn/ui components directory (often mostly generated)
 # Set to False if you want to count lines in src/components/ui
 EXCLUDE_SHADCN_UI_DIR = True
 SHADCN_UI_PATH = os.path.join('src', 'components', 'ui') # Relative path
+# Normalised once here so the walker can compare path components directly
+SHADCN_NORM = os.path.normpath(SHADCN_UI_PATH)
+SHADCN_PARTS = tuple(SHADCN_NORM.split(os.sep))
 
 # --- Script Logic ---
 
@@ -81,62 +98,74 @@ if EXCLUDE_SHADCN_UI_DIR:
 print(f"Excluding files: {', '.join(sorted(list(EXCLUDE_FILES)))}")
 print("-" * 30)
 
-for root, dirs, files in os.walk(repo_root, topdown=True):
-    # Modify dirs in-place to prune traversal into excluded directories
-    # Important: Use os.path.normpath to handle different path separators (e.g., on Windows)
-    current_rel_path = os.path.normpath(os.path.relpath(root, repo_root))
+def scan(path, shadcn_depth):
+    """Yield paths of source files under path, pruning excluded directories.
+
+    shadcn_depth is the number of leading path components that match
+    SHADCN_PARTS so far, or None once the path has diverged from it.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+
+            if entry.is_dir(follow_symlinks=False):
+                # Standard directory exclusion, done before descending
+                if name in EXCLUDE_DIRS:
+                    continue
+
+                # Optional shadcn/ui exclusion
+                child_depth = None
+                if shadcn_depth is not None and name == SHADCN_PARTS[shadcn_depth]:
+                    child_depth = shadcn_depth + 1
+                    if child_depth == len(SHADCN_PARTS):
+                        # print(f"Skipping directory (shadcn/ui): {entry.path}") # Uncomment for debugging
+                        continue
+
+                yield from scan(entry.path, child_depth)
+                continue
+
+            # Check if the specific file should be excluded
+            if name in EXCLUDE_FILES:
+                continue
+
+            # Check file extension
+            if not name.lower().endswith(SOURCE_EXT_SUFFIXES):
+                continue
 
-    # Standard directory exclusion
-    dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
+            yield entry.path
 
-    # Optional shadcn/ui exclusion
-    if EXCLUDE_SHADCN_UI_DIR and current_rel_path.startswith(os.path.normpath(SHADCN_UI_PATH)):
-        # If we are inside the shadcn UI path, clear dirs to stop descending
-        # and continue to the next iteration to avoid processing files in this root.
-        # print(f"Skipping directory (shadcn/ui): {current_rel_path}") # Uncomment for debugging
-        dirs[:] = [] # Stop traversing deeper into this excluded path
-        continue     # Skip processing files in this directory
 
-    for filename in files:
-        # Check if the specific file should be excluded
-        if filename in EXCLUDE_FILES:
-            continue
+def count_file_lines(file_path):
+    """Return the estimated LoC of a single file."""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return len(CODE_LINE_RE.findall(data))
 
-        # Check file extension
-        _, ext = os.path.splitext(filename)
-        if ext.lower() not in SOURCE_EXTENSIONS:
-            continue
 
-        file_path = os.path.join(root, filename)
-        relative_file_path = os.path.relpath(file_path, repo_root)
+# Phase 1: collect the files to count
+file_paths = list(scan(repo_root, 0 if EXCLUDE_SHADCN_UI_DIR else None))
 
-        # Count lines in the file
+# Phase 2: count them concurrently; reads release the GIL, so threads overlap I/O latency
+with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+    futures = [executor.submit(count_file_lines, file_path) for file_path in file_paths]
+
+    for file_path, future in zip(file_paths, futures):
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                file_loc = 0
-                for line in f:
-                    stripped_line = line.strip()
-                    # Skip empty lines
-                    if not stripped_line:
-                        continue
-                    # Simple check: skip lines starting with common comment markers
-                    is_comment_line = False
-                    for marker in SINGLE_LINE_COMMENT_MARKERS:
-                        if stripped_line.startswith(marker):
-                            is_comment_line = True
-                            break
-                    if not is_comment_line:
-                        file_loc += 1
-
-                # Uncomment the line below to see counts per file (can be verbose)
-                # print(f"{relative_file_path}: {file_loc}")
-
-                total_loc += file_loc
-                counted_files += 1
+            file_loc = future.result()
+
+            # Uncomment the line below to see counts per file (can be verbose)
+            # print(f"{file_path}: {file_loc}")
+
+            total_loc += file_loc
+            counted_files += 1
         except Exception as e:
-            error_files.append((relative_file_path, str(e)))
+            error_files.append((os.path.relpath(file_path, repo_root), str(e)))
             # Optional: print errors as they occur
-            # print(f"Error reading file {relative_file_path}: {e}", file=sys.stderr)
+            # print(f"Error reading file {file_path}: {e}", file=sys.stderr)
 
 print("-" * 30)
 print(f"Scan complete.")
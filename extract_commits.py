@@ -2,6 +2,17 @@
 import re
 import sys
 
+# A short commit hash wrapped in backticks; the closing backtick is a lookahead
+# so findall still sees hashes that share a backtick, e.g. `abc1234`def5678`
+HASH_RE = re.compile(r"`([a-f0-9]{7})(?=`)")
+
+# First hash on any line mentioning a Medium, High or Very High probability
+# (the last is covered by "High probability")
+TARGET_LINE_RE = re.compile(
+    r"^(?=.*(?:Medium|High) probability).*?" + HASH_RE.pattern,
+    re.MULTILINE,
+)
+
 
 def read_file(filename):
     try:
@@ -16,14 +27,8 @@ def main():
     potential_content = read_file("potential.md")
     pushes_content = read_file("pushes.md")
 
-    # Keywords to identify target commits
-    keywords = ["Medium probability", "High probability", "Very High probability"]
-    commit_hashes = set()
-    for line in potential_content.splitlines():
-        if any(keyword in line for keyword in keywords):
-            m = re.search(r"`([a-f0-9]{7})`", line)
-            if m:
-                commit_hashes.add(m.group(1))
+    # Collect target commits in one pass over the whole file
+    commit_hashes = set(TARGET_LINE_RE.findall(potential_content))
 
     if not commit_hashes:
         print("No medium or high potential commits found in potential.md")
@@ -35,10 +40,8 @@ def main():
 
     for section in sections:
         # Check if the section contains one of the commit hashes in the format `hash`
-        for commit in commit_hashes:
-            if f"`{commit}`" in section:
-                extracted_sections.append(section.strip())
-                break
+        if not commit_hashes.isdisjoint(HASH_RE.findall(section)):
+            extracted_sections.append(section.strip())
 
     if extracted_sections:
         print("\n---\n".join(extracted_sections))
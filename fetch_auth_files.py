@@ -1,4 +1,5 @@
-import os
+import io
+from pathlib import Path
 
 # List of files to fetch
 AUTH_FILES = [
@@ -235,40 +236,38 @@ PAGE_AUTH_DETAILS = {
 def read_file_content(filepath):
     """Read and return the content of a file"""
     try:
-        with open(filepath, 'r') as f:
-            return f.read()
-    except Exception as e:
+        return Path(filepath).read_text(encoding='utf-8', errors='replace')
+    except OSError as e:
         return f"Error reading file {filepath}: {str(e)}"
 
 def generate_markdown():
     """Generate markdown content with all auth-related files"""
-    markdown_content = ["# Authentication Files Documentation\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w("# Authentication Files Documentation\n\n")
     
     # Add overview
-    markdown_content.append("""## Overview
+    w("""## Overview
 This document contains all the authentication-related files from the codebase.
-Each file is documented with its full content for reference.\n""")
+Each file is documented with its full content for reference.\n\n""")
 
     # Add page authentication details
-    markdown_content.append("## Page Authentication Usage\n")
+    w("## Page Authentication Usage\n\n")
     for page, details in PAGE_AUTH_DETAILS.items():
-        markdown_content.append(f"### {page}\n{details}\n")
+        w(f"### {page}\n{details}\n\n")
     
     # Process each file
-    markdown_content.append("## Authentication Files\n")
+    w("## Authentication Files\n")
     for filepath in AUTH_FILES:
         # Add file header
-        markdown_content.append(f"### {filepath}\n")
-        markdown_content.append("```typescript")
-        
-        # Add file content
-        content = read_file_content(filepath)
-        markdown_content.append(content)
-        
-        # Close code block
-        markdown_content.append("```\n")
+        w(f"\n### {filepath}\n\n")
+
+        # Add file content in a code block
+        w("```typescript\n")
+        w(read_file_content(filepath))
+        w("\n```\n")
     
-    return "\n".join(markdown_content)
+    return buf.getvalue()
 
 def main():
     """Main function to generate and save the markdown file"""
@@ -277,7 +276,7 @@ def main():
     
     # Save to file
     output_file = "auth-files-documentation.md"
-    with open(output_file, 'w') as f:
+    with open(output_file, 'w', encoding='utf-8') as f:
         f.write(content)
     
     print(f"Documentation has been saved to {output_file}")
@@ -1,56 +1,101 @@
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Directory to scan (default to 'src', but allow override via CLI)
-search_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd() / "src"
-
-if not search_root.exists():
-    print(f"Search root '{search_root}' does not exist.")
-    sys.exit(1)
-
-# Regex patterns to identify red color usages
-patterns = [
-    re.compile(r"bg-red-\d+"),
-    re.compile(r"text-red-\d+"),
-    re.compile(r"border-red-\d+"),
-    re.compile(r"ring-red-\d+"),
-    re.compile(r"#[Ff]{2}[0]{4}"),  # #FF0000 (case-insensitive)
-    re.compile(r"#([Ff0]{3})"),      # #F00 or similar
-]
+# Single regex identifying red color usages, so each line is scanned once.
+# Bytes pattern so it can run directly over a memory-mapped file
+pattern = re.compile(
+    rb"(?:bg|text|border|ring)-red-\d+"  # Tailwind red utility classes
+    rb"|#[Ff]{2}[0]{4}"                  # #FF0000 (case-insensitive)
+    rb"|#[Ff0]{3}"                       # #F00 or similar
+)
 
 # File extensions to consider
 include_exts = {".tsx", ".ts", ".jsx", ".js", ".css", ".scss", ".html"}
 
-results = []
-
-for root, _dirs, files in os.walk(search_root):
-    # Skip node_modules and build directories if any
-    if "node_modules" in root.split(os.sep):
-        continue
-
-    for fname in files:
-        ext = Path(fname).suffix
-        if ext not in include_exts:
-            continue
-        fpath = Path(root) / fname
-        try:
-            with open(fpath, "r", encoding="utf-8", errors="ignore") as f:
-                for lineno, line in enumerate(f, start=1):
-                    for pat in patterns:
-                        if pat.search(line):
-                            try:
-                                rel_path = fpath.relative_to(Path.cwd())
-                            except ValueError:
-                                rel_path = fpath
-                            results.append((rel_path, lineno, line.rstrip()))
-                            break  # Avoid duplicate captures for same line
-        except Exception as e:
-            print(f"Error reading {fpath}: {e}", file=sys.stderr)
-
-# Output results
-for path, lineno, line in results:
-    print(f"{path}:{lineno}: {line}")
-
-print(f"\nTotal matches found: {len(results)}") 
\ No newline at end of file
+
+def collect_files(root):
+    """Yield paths of files to scan under root, in os.walk order."""
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip node_modules and build directories if any
+                    if entry.name != "node_modules":
+                        subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1] in include_exts:
+                    yield entry.path
+    except OSError as e:
+        print(f"Error reading {root}: {e}", file=sys.stderr)
+    for subdir in subdirs:
+        yield from collect_files(subdir)
+
+
+def scan_file(path):
+    """Return (path, lineno, line) for every line of the file using a red color."""
+    fpath = Path(path)
+    rows = []
+    try:
+        with open(fpath, "rb") as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return rows
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Scan the raw mapped bytes and only locate and decode the
+                # lines that match; most files have none
+                rel_path = None
+                lineno = 1
+                counted_to = 0
+                m = pattern.search(mm)
+                while m:
+                    line_start = mm.rfind(b"\n", 0, m.start()) + 1
+                    line_end = mm.find(b"\n", m.end())
+                    if line_end == -1:
+                        line_end = len(mm)
+                    lineno += mm[counted_to:line_start].count(b"\n")
+                    counted_to = line_start
+                    # Resolve the displayed path once per file, on its first match
+                    if rel_path is None:
+                        try:
+                            rel_path = str(fpath.relative_to(Path.cwd()))
+                        except ValueError:
+                            rel_path = str(fpath)
+                    line = mm[line_start:line_end].decode("utf-8", errors="ignore")
+                    rows.append((rel_path, lineno, line.rstrip()))
+                    # Resume after this line to avoid duplicate captures for same line
+                    m = pattern.search(mm, line_end)
+    except Exception as e:
+        print(f"Error reading {fpath}: {e}", file=sys.stderr)
+        return []
+    return rows
+
+
+def main():
+    # Directory to scan (default to 'src', but allow override via CLI)
+    search_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd() / "src"
+
+    if not search_root.exists():
+        print(f"Search root '{search_root}' does not exist.")
+        sys.exit(1)
+
+    paths = list(collect_files(search_root))
+
+    # Files are independent, so scan them across cores
+    results = []
+    with ProcessPoolExecutor() as executor:
+        for rows in executor.map(scan_file, paths, chunksize=64):
+            results.extend(rows)
+
+    # Output results
+    for path, lineno, line in results:
+        print(f"{path}:{lineno}: {line}")
+
+    print(f"\nTotal matches found: {len(results)}")
+
+
+if __name__ == "__main__":
+    main()